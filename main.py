@@ -1,17 +1,27 @@
 from typing import List, Tuple
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
 from urllib.parse import urljoin, urlparse
-from ollama import Client
-from google import genai
+import hashlib
+import json
+import orjson
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 import re
 import time
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 from datetime import datetime
-import msal
-import markdown
+
+# msal, markdown, jinja2, ollama, and google.genai are imported lazily inside
+# the functions that use them - together they add seconds to module import
+# that tooling merely importing this file shouldn't pay
 
 # Load environment variables
 load_dotenv()
@@ -19,6 +29,79 @@ load_dotenv()
 # LLM Model selection - can be 'Gemini' or 'Ollama'
 LLM_MODEL = os.getenv('LLM_MODEL', 'Gemini')
 
+# Shared request headers to avoid being blocked
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Shared session with connection pooling and retries so repeated calls to the
+# same hosts (HN, Graph API) reuse TCP/TLS connections instead of paying a
+# fresh handshake per request
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# On-disk response cache so re-runs (e.g. while iterating on the email
+# template) skip re-fetching articles and re-summarizing identical prompts.
+# Article pages expire after a day since news churns; Gemini responses are
+# prompt-deterministic enough to keep indefinitely
+CACHE_DIR = Path('.cache')
+ARTICLE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Non-content tags stripped from article pages before text extraction
+UNWANTED_TAGS = {'script', 'style', 'nav', 'header', 'footer', 'aside'}
+
+# Regexes used on every scraped article, compiled once at import
+_MULTI_NL = re.compile(r'\n\s*\n')
+_MULTI_SP = re.compile(r' +')
+_CONTENT_CLS = re.compile(r'content|article|post')
+_DIGITS = re.compile(r'\d+')
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def cache_get(key: str, ttl: float = None) -> bytes:
+    """
+    Look up a cached value by key.
+
+    Args:
+        key: The cache key (hashed to a filename)
+        ttl: Maximum age in seconds, or None for no expiry
+
+    Returns:
+        The cached bytes, or None on miss or expiry
+    """
+    path = _cache_path(key)
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def cache_set(key: str, value: bytes) -> None:
+    """
+    Store a value in the cache.
+
+    Args:
+        key: The cache key (hashed to a filename)
+        value: The bytes to store
+    """
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_path(key).write_bytes(value)
+    except OSError as e:
+        print(f"Warning: Failed to write cache entry: {e}")
+
 
 
 def scrape_titles(url: str) -> List[Tuple[str, str, str]]:
@@ -39,44 +122,38 @@ def scrape_titles(url: str) -> List[Tuple[str, str, str]]:
             print(f"Error: Invalid URL format: {url}")
             return []
         
-        # Set up headers to avoid being blocked
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # Make the request with timeout
-        response = requests.get(url, headers=headers, timeout=10)
+        # Make the request with timeout, reusing the pooled session
+        response = SESSION.get(url, timeout=10)
         response.raise_for_status()
         
-        # Parse the HTML
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all titles (Hacker News specific structure)
+        # Only build DOM nodes for the story rows we actually need
+        # (Hacker News specific structure: rows with class "athing"). The
+        # class match must be token-aware - at parse time the strainer sees
+        # the raw attribute string, and HN story rows carry
+        # class="athing submission"
+        strainer = SoupStrainer('tr', class_=lambda c: c and 'athing' in c.split())
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=strainer)
+
+        # Find all titles
         titles = []
-        
-        # Find all story rows with class "athing" - each has an id attribute with the item ID
-        story_rows = soup.find_all('tr', class_='athing')
-        
-        for row in story_rows:
+
+        for row in soup.find_all('tr'):
             # Get the item ID from the row
             item_id = row.get('id', '')
-            
-            # Find the titleline span within this row
-            titleline_span = row.find('span', class_='titleline')
-            
-            if titleline_span and item_id:
-                # Find the link within the titleline span
-                link = titleline_span.find('a')
-                if link:
-                    title_text = link.get_text(strip=True)
-                    href = link.get('href', '')
-                    
-                    # Convert relative URLs to absolute URLs
-                    if href:
-                        article_url = urljoin(url, href)
-                        # Construct the comments URL using the item ID
-                        comments_url = f"https://news.ycombinator.com/item?id={item_id}"
-                        titles.append((title_text, article_url, comments_url))
+
+            # Find the title link within this row in one selector pass
+            link = row.select_one('span.titleline a')
+
+            if link and item_id:
+                title_text = link.get_text(strip=True)
+                href = link.get('href', '')
+
+                # Convert relative URLs to absolute URLs
+                if href:
+                    article_url = urljoin(url, href)
+                    # Construct the comments URL using the item ID
+                    comments_url = f"https://news.ycombinator.com/item?id={item_id}"
+                    titles.append((title_text, article_url, comments_url))
         
         print(f"Successfully scraped {len(titles)} titles from {url}")
         return titles
@@ -98,75 +175,171 @@ def scrape_titles(url: str) -> List[Tuple[str, str, str]]:
         return []
 
 
-def scrape_article_and_comments(article_url: str, comments_url: str) -> Tuple[str, str]:
+def scrape_many(urls: List[str], workers: int = 8) -> List[Tuple[str, str, str]]:
     """
-    Scrape full text content from both an article page and its Hacker News comments page.
-    
+    Scrape titles from multiple source URLs in parallel.
+
+    The workload is network-bound and releases the GIL during socket I/O, so
+    threads fan out the requests while every worker reuses the shared pooled
+    SESSION.
+
     Args:
-        article_url: URL of the article to scrape
-        comments_url: URL of the Hacker News comments page
-        
+        urls: The list of source URLs to scrape
+        workers: Maximum number of concurrent threads (default 8)
+
     Returns:
-        A tuple containing (article_text, comments_text)
-        Returns empty strings for any failed scrapes
+        A flattened list of (title, article_url, comments_url) triplets from
+        all sources, in input URL order
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(itertools.chain.from_iterable(executor.map(scrape_titles, urls)))
+
+
+def parse_article(content: bytes) -> str:
+    """
+    Extract readable article text from raw HTML content.
+
+    Args:
+        content: Raw HTML bytes of the article page
+
+    Returns:
+        The cleaned article text, or an empty string on error
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
-    
-    # Scrape article content
-    article_text = ""
     try:
-        response = requests.get(article_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script, style, and navigation elements
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        soup = BeautifulSoup(content, 'lxml')
+
+        # Remove script, style, and navigation elements in one find_all pass -
+        # bs4 matches a set of tag names in a single tree walk
+        for element in soup.find_all(UNWANTED_TAGS):
             element.decompose()
-        
+
         # Try to find main content areas (common patterns)
-        main_content = soup.find('article') or soup.find('main') or soup.find('div', class_=re.compile(r'content|article|post'))
-        
+        main_content = soup.find('article') or soup.find('main') or soup.find('div', class_=_CONTENT_CLS)
+
         if main_content:
             article_text = main_content.get_text(separator='\n', strip=True)
         else:
-            # Fallback to body text
-            article_text = soup.get_text(separator='\n', strip=True)
-        
+            # Fallback to body text - use lxml directly here, since
+            # text_content() extracts the visible text in one C-level
+            # traversal instead of re-walking every node in Python
+            doc = lxml_html.fromstring(content)
+            for bad in list(doc.iter(*UNWANTED_TAGS)):
+                bad.drop_tree()
+            article_text = doc.text_content()
+
         # Clean up excessive whitespace
-        article_text = re.sub(r'\n\s*\n', '\n\n', article_text)
-        article_text = re.sub(r' +', ' ', article_text)
-        
+        article_text = _MULTI_NL.sub('\n\n', article_text)
+        article_text = _MULTI_SP.sub(' ', article_text)
+
+        return article_text
+
     except Exception as e:
-        print(f"Error scraping article {article_url}: {e}")
-        article_text = ""
-    
-    # Scrape Hacker News comments
-    comments_text = ""
+        print(f"Error parsing article: {e}")
+        return ""
+
+
+def parse_comments(content: bytes) -> str:
+    """
+    Extract comment text from a raw Hacker News comments page.
+
+    Args:
+        content: Raw HTML bytes of the comments page
+
+    Returns:
+        The joined comment text, or an empty string on error
+    """
     try:
-        response = requests.get(comments_url, headers=headers, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Find all comment containers
-        comments = []
-        comment_elements = soup.find_all('div', class_='comment')
-        
-        for comment in comment_elements:
-            # Extract comment text
-            comment_span = comment.find('span', class_='commtext')
-            if comment_span:
-                comment_text = comment_span.get_text(separator=' ', strip=True)
-                comments.append(comment_text)
-        
-        comments_text = '\n\n---\n\n'.join(comments)
-        
+        soup = BeautifulSoup(content, 'lxml')
+
+        # A single CSS selector dispatches the traversal to lxml's C level
+        # instead of a nested Python-level find loop. Very short comments
+        # carry no summarizable signal, so drop them before they cost tokens
+        comments = [comment_text
+                    for span in soup.select('div.comment span.commtext')
+                    if len(comment_text := span.get_text(separator=' ', strip=True)) >= 20]
+
+        return '\n\n---\n\n'.join(comments)
+
     except Exception as e:
-        print(f"Error scraping comments {comments_url}: {e}")
-        comments_text = ""
-    
-    return article_text, comments_text
+        print(f"Error parsing comments: {e}")
+        return ""
+
+
+async def fetch(session: aiohttp.ClientSession, url: str, semaphore: asyncio.Semaphore) -> bytes:
+    """
+    Fetch a URL asynchronously, bounded by a semaphore.
+
+    Args:
+        session: The shared aiohttp client session
+        url: The URL to fetch
+        semaphore: Semaphore limiting concurrent requests
+
+    Returns:
+        The raw response body as bytes
+
+    Raises:
+        aiohttp.ClientError: On connection or HTTP errors
+    """
+    cache_key = f'GET:{url}'
+    cached = cache_get(cache_key, ttl=ARTICLE_CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    async with semaphore:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+    cache_set(cache_key, body)
+    return body
+
+
+async def scrape_articles_and_comments(url_pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    Concurrently scrape article pages and their Hacker News comments pages.
+
+    All requests are fired at once (bounded by a semaphore) so total scrape
+    time is roughly the slowest request rather than the sum of all requests.
+
+    Args:
+        url_pairs: List of (article_url, comments_url) tuples
+
+    Returns:
+        A list of (article_text, comments_text) tuples, one per input pair.
+        Returns empty strings for any failed scrapes.
+    """
+    # Limit concurrent requests to avoid hammering hosts
+    semaphore = asyncio.Semaphore(10)
+    connector = aiohttp.TCPConnector(limit=20)
+
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        # Fetch all article and comments pages concurrently
+        tasks = [fetch(session, url, semaphore)
+                 for article_url, comments_url in url_pairs
+                 for url in (article_url, comments_url)]
+        pages = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = []
+        for i, (article_url, comments_url) in enumerate(url_pairs):
+            article_page = pages[2 * i]
+            comments_page = pages[2 * i + 1]
+
+            # Parse in a worker thread so the event loop isn't blocked
+            article_text = ""
+            if isinstance(article_page, BaseException):
+                print(f"Error scraping article {article_url}: {article_page}")
+            else:
+                article_text = await asyncio.to_thread(parse_article, article_page)
+
+            comments_text = ""
+            if isinstance(comments_page, BaseException):
+                print(f"Error scraping comments {comments_url}: {comments_page}")
+            else:
+                comments_text = await asyncio.to_thread(parse_comments, comments_page)
+
+            results.append((article_text, comments_text))
+
+        return results
 
 
 def parse_ai_response(response_text: str) -> List[int]:
@@ -177,11 +350,110 @@ def parse_ai_response(response_text: str) -> List[int]:
         response_text: The AI's response containing article indexes
         
     Returns:
-        List of integer indexes
+        List of unique integer indexes, in first-seen order
+    """
+    # finditer avoids materializing an intermediate list of substrings, and
+    # dict.fromkeys deduplicates repeated indexes while preserving order
+    return list(dict.fromkeys(int(match.group()) for match in _DIGITS.finditer(response_text)))
+
+
+# Token budgets for the per-article prompt sections. Character slicing under-
+# or over-shoots the model's actual context budget, so bound by tokens instead
+# (2500 tokens is roughly the 10k characters the old slicing allowed)
+MAX_ARTICLE_TOKENS = 2500
+MAX_COMMENTS_TOKENS = 2500
+
+_TOKEN_ENCODER = None
+
+
+def _get_token_encoder():
+    """
+    Return the shared tiktoken encoder, loading it on first use.
+
+    cl100k_base is not Gemini's exact tokenizer, but it is close enough for
+    length estimation.
+    """
+    global _TOKEN_ENCODER
+
+    if _TOKEN_ENCODER is None:
+        import tiktoken
+        _TOKEN_ENCODER = tiktoken.get_encoding('cl100k_base')
+
+    return _TOKEN_ENCODER
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most max_tokens tokens.
+
+    Args:
+        text: The text to truncate
+        max_tokens: Maximum number of tokens to keep
+
+    Returns:
+        The text unchanged if it fits, otherwise the leading max_tokens
+        tokens with a truncation marker appended
     """
-    # Remove quotes and extract numbers
-    numbers = re.findall(r'\d+', response_text)
-    return [int(num) for num in numbers]
+    encoder = _get_token_encoder()
+    token_ids = encoder.encode(text)
+    if len(token_ids) <= max_tokens:
+        return text
+    return encoder.decode(token_ids[:max_tokens]) + "\n...[truncated]"
+
+
+# Number of articles summarized per LLM call - batching amortizes the fixed
+# instruction preamble across articles, but larger batches start to degrade
+# per-article accuracy
+SUMMARY_BATCH_SIZE = 6
+
+# Marker line each per-article block in a batched summary response starts with
+_ARTICLE_MARKER = re.compile(r'^### ARTICLE (\d+)\s*$', re.MULTILINE)
+
+
+def build_batch_summary_prompt(articles: List[dict], keywords_text: str, template: str) -> str:
+    """
+    Build a single summarization prompt covering a batch of articles.
+
+    Args:
+        articles: List of article dicts with 'index', 'title', 'article_text',
+                  and 'comments_text' keys
+        keywords_text: Comma-separated keywords string
+        template: The batch summary prompt template
+
+    Returns:
+        The full prompt string with all article blocks interpolated
+    """
+    article_blocks = []
+    for article in articles:
+        article_blocks.append(
+            f"[ARTICLE {article['index']}]\n"
+            f"**Title:** {article['title']}\n\n"
+            f"**Content:**\n{article['article_text']}\n\n"
+            f"**Hacker News Comments:**\n{article['comments_text']}"
+        )
+
+    return template.format(
+        articles='\n\n'.join(article_blocks),
+        keywords=keywords_text
+    )
+
+
+def parse_batch_summary_response(response_text: str) -> dict:
+    """
+    Split a batched summary response into per-article summaries.
+
+    Args:
+        response_text: The AI's response containing '### ARTICLE <n>' blocks
+
+    Returns:
+        Dict mapping article index (int) to its summary text
+    """
+    # re.split on the marker yields [preamble, num, block, num, block, ...]
+    parts = _ARTICLE_MARKER.split(response_text)
+    summaries = {}
+    for i in range(1, len(parts) - 1, 2):
+        summaries[int(parts[i])] = parts[i + 1].strip()
+    return summaries
 
 
 def call_gemini_with_retry(client, prompt: str, max_retries: int = 3) -> tuple[str, dict]:
@@ -203,8 +475,14 @@ def call_gemini_with_retry(client, prompt: str, max_retries: int = 3) -> tuple[s
     Raises:
         Exception: If all retries fail
     """
+    cache_key = f'gemini:gemini-3-flash-preview:{prompt}'
+    cached = cache_get(cache_key)
+    if cached is not None:
+        response_text, telemetry = json.loads(cached)
+        return response_text, telemetry
+
     retry_delays = [1, 2, 4]  # Exponential backoff: 1s, 2s, 4s
-    
+
     for attempt in range(max_retries):
         try:
             start_time = time.time()
@@ -225,9 +503,11 @@ def call_gemini_with_retry(client, prompt: str, max_retries: int = 3) -> tuple[s
                 'total_tokens': input_tokens + output_tokens,
                 'model': 'gemini-3-flash-preview'
             }
-            
+
+            cache_set(cache_key, json.dumps([response.text, telemetry]).encode('utf-8'))
+
             return response.text, telemetry
-            
+
         except Exception as e:
             error_str = str(e)
             # Check if it's a 503 error
@@ -247,6 +527,182 @@ def call_gemini_with_retry(client, prompt: str, max_retries: int = 3) -> tuple[s
     raise Exception("Max retries exceeded")
 
 
+async def call_gemini_with_retry_async(client, prompt: str, max_retries: int = 3) -> tuple[str, dict]:
+    """
+    Async counterpart of call_gemini_with_retry, using the SDK's aio client.
+
+    Args:
+        client: The Gemini client
+        prompt: The prompt to send
+        max_retries: Maximum number of retries (default 3)
+
+    Returns:
+        Tuple of (response_text, telemetry_dict) - same shape as
+        call_gemini_with_retry
+
+    Raises:
+        Exception: If all retries fail
+    """
+    cache_key = f'gemini:gemini-3-flash-preview:{prompt}'
+    cached = cache_get(cache_key)
+    if cached is not None:
+        response_text, telemetry = json.loads(cached)
+        return response_text, telemetry
+
+    retry_delays = [1, 2, 4]  # Exponential backoff: 1s, 2s, 4s
+
+    for attempt in range(max_retries):
+        try:
+            start_time = time.time()
+            response = await client.aio.models.generate_content(
+                model="gemini-3-flash-preview",
+                contents=prompt,
+            )
+            duration = time.time() - start_time
+
+            # Extract token usage if available
+            input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+            output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+
+            telemetry = {
+                'duration': duration,
+                'input_tokens': input_tokens,
+                'output_tokens': output_tokens,
+                'total_tokens': input_tokens + output_tokens,
+                'model': 'gemini-3-flash-preview'
+            }
+
+            cache_set(cache_key, json.dumps([response.text, telemetry]).encode('utf-8'))
+
+            return response.text, telemetry
+
+        except Exception as e:
+            error_str = str(e)
+            # Check if it's a retryable overload/rate-limit error
+            if '503' in error_str or '429' in error_str or 'overloaded' in error_str.lower():
+                if attempt < max_retries - 1:  # Don't sleep on the last attempt
+                    delay = retry_delays[attempt]
+                    print(f"    Model overloaded. Retrying in {delay}s... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(delay)
+                else:
+                    print(f"    Failed after {max_retries} attempts.")
+                    raise
+            else:
+                # For non-retryable errors, raise immediately
+                raise
+
+    # This shouldn't be reached, but just in case
+    raise Exception("Max retries exceeded")
+
+
+# Concurrent in-flight Gemini summary calls; tune down if 429s start appearing
+GEMINI_CONCURRENCY = 8
+
+# Use Gemini's Batch endpoint for summaries - half the cost of interactive
+# calls, at the price of minute-scale turnaround. Worth it since the
+# newsletter job is offline; the interactive article-selection call always
+# stays on the real-time API where latency matters
+GEMINI_USE_BATCH_API = os.getenv('GEMINI_USE_BATCH_API', 'false').lower() == 'true'
+
+
+def summarize_with_batch_api(client, batches: List[List[dict]], keywords_text: str, template: str,
+                             poll_interval: int = 30, timeout: int = 1800) -> list:
+    """
+    Submit all batch summary prompts as a single Gemini Batch API job.
+
+    The Batch endpoint is billed at 50% of interactive pricing and avoids
+    per-request queueing, in exchange for minute-scale completion times.
+
+    Args:
+        client: The Gemini client
+        batches: List of article batches (each a list of article dicts)
+        keywords_text: Comma-separated keywords string
+        template: The batch summary prompt template
+        poll_interval: Seconds between job status polls (default 30)
+        timeout: Maximum seconds to wait for the job (default 1800)
+
+    Returns:
+        A list with one (response_text, telemetry) tuple per batch, or an
+        Exception for batches that failed - same shape as
+        summarize_batches_async
+
+    Raises:
+        Exception: If the job fails, is cancelled, or times out
+    """
+    inline_requests = [
+        {'contents': [{'role': 'user',
+                       'parts': [{'text': build_batch_summary_prompt(batch, keywords_text, template)}]}]}
+        for batch in batches
+    ]
+
+    start_time = time.time()
+    job = client.batches.create(model="gemini-3-flash-preview", src=inline_requests)
+    print(f"    Batch job submitted: {job.name}")
+
+    # Poll until the job reaches a terminal state
+    while job.state.name not in ('JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED', 'JOB_STATE_CANCELLED'):
+        if time.time() - start_time > timeout:
+            raise Exception(f"Batch job {job.name} timed out after {timeout}s")
+        time.sleep(poll_interval)
+        job = client.batches.get(name=job.name)
+        print(f"    Batch job state: {job.state.name} ({time.time() - start_time:.0f}s elapsed)")
+
+    if job.state.name != 'JOB_STATE_SUCCEEDED':
+        raise Exception(f"Batch job {job.name} finished in state {job.state.name}")
+
+    duration = time.time() - start_time
+
+    # Inlined responses come back in the same order as the submitted requests
+    results = []
+    for inlined in job.dest.inlined_responses:
+        if inlined.error:
+            results.append(Exception(str(inlined.error)))
+            continue
+
+        response = inlined.response
+        input_tokens = getattr(response.usage_metadata, 'prompt_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+        output_tokens = getattr(response.usage_metadata, 'candidates_token_count', 0) if hasattr(response, 'usage_metadata') else 0
+
+        telemetry = {
+            'duration': duration,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens,
+            'model': 'gemini-3-flash-preview (batch)'
+        }
+
+        results.append((response.text, telemetry))
+
+    return results
+
+
+async def summarize_batches_async(client, batches: List[List[dict]], keywords_text: str, template: str) -> list:
+    """
+    Fire all batch summary calls at Gemini concurrently.
+
+    Total latency collapses to roughly the slowest call rather than the sum,
+    with a semaphore bounding in-flight requests to respect rate limits.
+
+    Args:
+        client: The Gemini client
+        batches: List of article batches (each a list of article dicts)
+        keywords_text: Comma-separated keywords string
+        template: The batch summary prompt template
+
+    Returns:
+        A list with one (response_text, telemetry) tuple per batch, or the
+        raised exception for batches that failed
+    """
+    semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    async def summarize_one(batch):
+        prompt = build_batch_summary_prompt(batch, keywords_text, template)
+        async with semaphore:
+            return await call_gemini_with_retry_async(client, prompt)
+
+    return await asyncio.gather(*[summarize_one(batch) for batch in batches], return_exceptions=True)
+
+
 def call_ollama_with_retry(client, prompt: str, max_retries: int = 3, model: str = 'qwen3:8b') -> tuple[str, dict]:
     """
     Call Ollama API with exponential backoff retry on errors.
@@ -267,6 +723,7 @@ def call_ollama_with_retry(client, prompt: str, max_retries: int = 3, model: str
     Raises:
         Exception: If all retries fail
     """
+    from ollama import Client
 
     client = Client(
         host='http://192.168.11.81:11434',
@@ -318,6 +775,43 @@ def call_ollama_with_retry(client, prompt: str, max_retries: int = 3, model: str
     raise Exception("Max retries exceeded")
 
 
+# Jinja2 environment and compiled email template, built on first use and
+# reused afterwards - template compilation is expensive and the template
+# never changes mid-run
+_JINJA_ENV = None
+_TEMPLATE = None
+
+
+def _get_email_template():
+    """
+    Return the compiled email template, building the Jinja2 environment on
+    first use.
+
+    Returns:
+        The compiled jinja2 Template for email_template.html
+
+    Raises:
+        jinja2.TemplateNotFound: If email_template.html is missing
+    """
+    global _JINJA_ENV, _TEMPLATE
+
+    if _TEMPLATE is None:
+        from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+
+        # Persist compiled template bytecode next to the response cache so
+        # even cold starts skip re-parsing
+        CACHE_DIR.mkdir(exist_ok=True)
+        _JINJA_ENV = Environment(
+            loader=FileSystemLoader('.'),
+            auto_reload=False,
+            cache_size=64,
+            bytecode_cache=FileSystemBytecodeCache(str(CACHE_DIR))
+        )
+        _TEMPLATE = _JINJA_ENV.get_template('email_template.html')
+
+    return _TEMPLATE
+
+
 def render_newsletter_email(summaries: List[dict], keywords: List[str], total_articles: int) -> str:
     """
     Render the newsletter HTML email using Jinja2 template.
@@ -330,10 +824,12 @@ def render_newsletter_email(summaries: List[dict], keywords: List[str], total_ar
     Returns:
         Rendered HTML email as a string
     """
+    import markdown
+    from jinja2 import TemplateNotFound
+
     try:
-        # Set up Jinja2 environment
-        env = Environment(loader=FileSystemLoader('.'))
-        template = env.get_template('email_template.html')
+        # Fetch the cached, pre-compiled template
+        template = _get_email_template()
         
         # Generate newsletter title based on keywords
         if keywords:
@@ -345,15 +841,15 @@ def render_newsletter_email(summaries: List[dict], keywords: List[str], total_ar
         # Format current date
         current_date = datetime.now().strftime("%B %d, %Y")
         
-        # Convert markdown summaries to HTML
+        # Convert markdown summaries to HTML, reusing one Markdown instance -
+        # markdown.markdown() would re-register extensions and recompile their
+        # regexes for every article
+        md = markdown.Markdown(extensions=['extra', 'nl2br', 'sane_lists'])
         processed_summaries = []
         for summary in summaries:
             processed_summary = summary.copy()
             # Convert markdown to HTML
-            processed_summary['summary'] = markdown.markdown(
-                summary['summary'],
-                extensions=['extra', 'nl2br', 'sane_lists']
-            )
+            processed_summary['summary'] = md.reset().convert(summary['summary'])
             processed_summaries.append(processed_summary)
         
         # Render the template
@@ -376,6 +872,86 @@ def render_newsletter_email(summaries: List[dict], keywords: List[str], total_ar
         return ""
 
 
+def render_and_send_newsletter(summaries: List[dict], keywords: List[str], total_articles: int,
+                               recipients: List[str], subject: str) -> bool:
+    """
+    Render the newsletter and send it in one step.
+
+    The rendered HTML flows straight into the Graph API payload - with the
+    cached template and cached access token, the critical path is a single
+    TLS round-trip to the sendMail endpoint.
+
+    Args:
+        summaries: List of article summary dictionaries
+        keywords: List of keyword strings
+        total_articles: Total number of articles analyzed
+        recipients: List of email addresses
+        subject: Email subject line
+
+    Returns:
+        Boolean indicating success/failure
+    """
+    html_content = render_newsletter_email(summaries, keywords, total_articles)
+
+    if not html_content:
+        print("✗ Failed to render email template. Email not sent.")
+        return False
+
+    return send_newsletter_email(html_content, recipients, subject)
+
+
+# Cached MSAL app and access token - client-credential tokens are valid for
+# about an hour, so repeated sends skip the full OAuth exchange
+_MSAL_APP = None
+_TOKEN_CACHE = {'token': None, 'expires_at': 0}
+
+
+def get_graph_token() -> str:
+    """
+    Return a valid Microsoft Graph access token, reusing the cached one
+    until shortly before it expires.
+
+    Returns:
+        The access token string, or None if authentication failed
+    """
+    global _MSAL_APP
+
+    # Reuse the cached token with a 60s safety margin before expiry
+    if _TOKEN_CACHE['token'] and time.time() < _TOKEN_CACHE['expires_at'] - 60:
+        return _TOKEN_CACHE['token']
+
+    client_id = os.getenv("CLIENT_ID")
+    tenant_id = os.getenv("TENANT_ID")
+    client_secret = os.getenv("CLIENT_SECRET")
+
+    if not all([client_id, tenant_id, client_secret]):
+        print("Error: Missing required environment variables (CLIENT_ID, TENANT_ID, CLIENT_SECRET)")
+        return None
+
+    import msal
+
+    print("    Authenticating with Microsoft Graph API...")
+    if _MSAL_APP is None:
+        authority = f"https://login.microsoftonline.com/{tenant_id}"
+        _MSAL_APP = msal.ConfidentialClientApplication(
+            client_id,
+            authority=authority,
+            client_credential=client_secret
+        )
+
+    token_response = _MSAL_APP.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
+
+    if "access_token" not in token_response:
+        print(f"    Error: Failed to acquire access token: {token_response.get('error_description', 'Unknown error')}")
+        return None
+
+    _TOKEN_CACHE['token'] = token_response['access_token']
+    _TOKEN_CACHE['expires_at'] = time.time() + token_response.get('expires_in', 3600)
+    print("    ✓ Access token acquired successfully")
+
+    return _TOKEN_CACHE['token']
+
+
 def send_newsletter_email(html_content: str, recipients: List[str], subject: str) -> bool:
     """
     Send newsletter email using Microsoft Graph API.
@@ -389,36 +965,18 @@ def send_newsletter_email(html_content: str, recipients: List[str], subject: str
         Boolean indicating success/failure
     """
     try:
-        # Load credentials from environment
-        client_id = os.getenv("CLIENT_ID")
-        tenant_id = os.getenv("TENANT_ID")
-        client_secret = os.getenv("CLIENT_SECRET")
+        # Load sender address from environment
         sender_email = os.getenv("SENDER_EMAIL")
-        
-        # Validate required environment variables
-        if not all([client_id, tenant_id, client_secret, sender_email]):
-            print("Error: Missing required environment variables (CLIENT_ID, TENANT_ID, CLIENT_SECRET, SENDER_EMAIL)")
+
+        if not sender_email:
+            print("Error: Missing required environment variable SENDER_EMAIL")
             return False
-        
-        # Authenticate with Microsoft Graph API
-        print("    Authenticating with Microsoft Graph API...")
-        authority = f"https://login.microsoftonline.com/{tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            client_id,
-            authority=authority,
-            client_credential=client_secret
-        )
-        
-        # Acquire token
-        token_response = app.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
-        
-        if "access_token" not in token_response:
-            print(f"    Error: Failed to acquire access token: {token_response.get('error_description', 'Unknown error')}")
+
+        # Authenticate with Microsoft Graph API (cached across sends)
+        access_token = get_graph_token()
+        if not access_token:
             return False
-        
-        access_token = token_response['access_token']
-        print("    ✓ Access token acquired successfully")
-        
+
         # Prepare email data
         to_recipients = [{"emailAddress": {"address": recipient}} for recipient in recipients]
         
@@ -441,7 +999,10 @@ def send_newsletter_email(html_content: str, recipients: List[str], subject: str
             'Content-Type': 'application/json'
         }
         
-        response = requests.post(endpoint, json=email_data, headers=headers)
+        # orjson serializes the payload (dominated by the HTML body, which can
+        # be tens of KB) several times faster than the stdlib json path the
+        # json= keyword would use, and emits bytes directly
+        response = SESSION.post(endpoint, data=orjson.dumps(email_data), headers=headers, timeout=10)
         
         if response.status_code == 202:
             for recipient in recipients:
@@ -458,9 +1019,21 @@ def send_newsletter_email(html_content: str, recipients: List[str], subject: str
 
 
 if __name__ == "__main__":
-    # Initialize Gemini client
+    import httpx
+    from google import genai
+
+    # Initialize Gemini client, routing the SDK's transport over HTTP/2 so
+    # the concurrent summary batches multiplex over a single connection
+    # instead of queueing on per-host HTTP/1.1 connection limits
     api_key = os.getenv("GEMINI_API_KEY")
-    client = genai.Client(api_key=api_key)
+    _http_args = {
+        'http2': True,
+        'limits': httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    }
+    client = genai.Client(
+        api_key=api_key,
+        http_options={'client_args': _http_args, 'async_client_args': _http_args}
+    )
     
     # Test the scraper with Hacker News
     test_url = "https://news.ycombinator.com/"
@@ -485,12 +1058,12 @@ if __name__ == "__main__":
     with open('newsletter_prompt_context.md', 'r', encoding='utf-8') as f:
         prompt_context = f.read()
     
-    # Build the titles list as a formatted string
-    titles_text = ""
-    for i, (title, article_url, comments_url) in enumerate(results, 1):
-        titles_text += f"{i}. {title}\n"
-        titles_text += f"   Article: {article_url}\n"
-        titles_text += f"   Comments: {comments_url}\n\n"
+    # Build the titles list as a formatted string in one join pass - repeated
+    # += concatenation re-copies the accumulated string every iteration
+    titles_text = '\n'.join(
+        f"{i}. {title}\n   Article: {article_url}\n   Comments: {comments_url}\n"
+        for i, (title, article_url, comments_url) in enumerate(results, 1)
+    )
     
     # Build the keywords string
     keywords_text = ", ".join(keywords)
@@ -537,81 +1110,117 @@ KEYWORDS: {keywords_text}
         print(f"Processing {len(selected_indexes)} selected articles...")
         print("="*80 + "\n")
         
-        summaries = []
-        
+        # Validate indexes and collect the selected articles
+        selected_articles = []
         for idx in selected_indexes:
             # Convert 1-based index to 0-based
             array_idx = idx - 1
-            
+
             # Validate index
             if array_idx < 0 or array_idx >= len(results):
                 print(f"Warning: Index {idx} is out of range. Skipping.")
                 continue
-            
-            title, article_url, comments_url = results[array_idx]
-            
+
+            selected_articles.append((idx, *results[array_idx]))
+
+        # Scrape all selected articles and their comments concurrently
+        print(f"Scraping {len(selected_articles)} articles and comment pages concurrently...")
+        scraped_contents = asyncio.run(scrape_articles_and_comments(
+            [(article_url, comments_url) for _, _, article_url, comments_url in selected_articles]
+        ))
+
+        # Collect the articles that scraped successfully, truncated to avoid token limits
+        articles_to_summarize = []
+
+        for (idx, title, article_url, comments_url), (article_text, comments_text) in zip(selected_articles, scraped_contents):
             print(f"\n[{idx}] Processing: {title}")
             print(f"    Article URL: {article_url}")
             print(f"    Comments URL: {comments_url}")
-            
-            # Scrape article and comments
-            print(f"    Scraping content...")
-            article_text, comments_text = scrape_article_and_comments(article_url, comments_url)
-            
+
             if not article_text and not comments_text:
                 print(f"    Failed to scrape content. Skipping.")
                 continue
-            
-            # Truncate if too long to avoid token limits
-            max_article_length = 10000
-            max_comments_length = 10000
-            
-            if len(article_text) > max_article_length:
-                article_text = article_text[:max_article_length] + "\n...[truncated]"
-            
-            if len(comments_text) > max_comments_length:
-                comments_text = comments_text[:max_comments_length] + "\n...[truncated]"
-            
-            # Read the summary prompt context and build the prompt
-            with open('summary_prompt_context.md', 'r', encoding='utf-8') as f:
-                summary_prompt_template = f.read()
-            
-            summary_prompt = summary_prompt_template.format(
-                title=title,
-                article_text=article_text,
-                comments_text=comments_text,
-                keywords=keywords_text
-            )
-            
-            print(f"    Generating AI summary...")
-            
-            try:
-                if LLM_MODEL == 'Ollama':
-                    summary, summary_telemetry = call_ollama_with_retry(client, summary_prompt, model='qwen3:8b')
-                elif LLM_MODEL == 'Gemini':
-                    summary, summary_telemetry = call_gemini_with_retry(client, summary_prompt)
-                else:
-                    raise ValueError(f"Unsupported LLM_MODEL: {LLM_MODEL}")
 
-                print(f"    ✓ Summary generated successfully")
-                print(f"    📊 {summary_telemetry['duration']:.2f}s | "
-                      f"In: {summary_telemetry['input_tokens']} | Out: {summary_telemetry['output_tokens']} | "
-                      f"Total: {summary_telemetry['total_tokens']} tokens")
+            # Truncate by tokens rather than characters so each article gets a
+            # predictable share of the model's context budget
+            article_text = truncate_to_tokens(article_text, MAX_ARTICLE_TOKENS)
+            comments_text = truncate_to_tokens(comments_text, MAX_COMMENTS_TOKENS)
+
+            articles_to_summarize.append({
+                'index': idx,
+                'title': title,
+                'article_url': article_url,
+                'comments_url': comments_url,
+                'article_text': article_text,
+                'comments_text': comments_text
+            })
+
+        # Read the batch summary prompt context once
+        with open('batch_summary_prompt_context.md', 'r', encoding='utf-8') as f:
+            batch_prompt_template = f.read()
+
+        # Chunk the articles into batches - one LLM call covers several articles,
+        # so the shared instruction preamble is sent once per batch instead of
+        # per article
+        batches = [articles_to_summarize[batch_start:batch_start + SUMMARY_BATCH_SIZE]
+                   for batch_start in range(0, len(articles_to_summarize), SUMMARY_BATCH_SIZE)]
+
+        print(f"\nGenerating AI summaries for {len(articles_to_summarize)} articles "
+              f"in {len(batches)} batch(es)...")
+
+        if LLM_MODEL == 'Ollama':
+            # Local Ollama is serialized by the server anyway, so call in sequence
+            batch_responses = []
+            for batch in batches:
+                batch_prompt = build_batch_summary_prompt(batch, keywords_text, batch_prompt_template)
+                try:
+                    batch_responses.append(call_ollama_with_retry(client, batch_prompt, model='qwen3:8b'))
+                except Exception as e:
+                    batch_responses.append(e)
+        elif LLM_MODEL == 'Gemini':
+            if GEMINI_USE_BATCH_API:
+                # Offline Batch endpoint: 50% cost, minute-scale turnaround
+                batch_responses = summarize_with_batch_api(client, batches, keywords_text, batch_prompt_template)
+            else:
+                # Fire all batch calls concurrently via the async client
+                batch_responses = asyncio.run(
+                    summarize_batches_async(client, batches, keywords_text, batch_prompt_template)
+                )
+        else:
+            raise ValueError(f"Unsupported LLM_MODEL: {LLM_MODEL}")
+
+        summaries = []
+
+        for batch, response in zip(batches, batch_responses):
+            batch_indexes = [article['index'] for article in batch]
+
+            if isinstance(response, BaseException):
+                print(f"    Error generating summaries for articles {batch_indexes}: {response}")
+                continue
+
+            response_text, summary_telemetry = response
+
+            print(f"    📊 Articles {batch_indexes} | {summary_telemetry['duration']:.2f}s | "
+                  f"In: {summary_telemetry['input_tokens']} | Out: {summary_telemetry['output_tokens']} | "
+                  f"Total: {summary_telemetry['total_tokens']} tokens")
+
+            batch_summaries = parse_batch_summary_response(response_text)
+
+            for article in batch:
+                summary = batch_summaries.get(article['index'])
+                if summary is None:
+                    print(f"    Warning: No summary found for article {article['index']}. Skipping.")
+                    continue
 
                 summaries.append({
-                    'index': idx,
-                    'title': title,
-                    'article_url': article_url,
-                    'comments_url': comments_url,
+                    'index': article['index'],
+                    'title': article['title'],
+                    'article_url': article['article_url'],
+                    'comments_url': article['comments_url'],
                     'summary': summary
                 })
-                
-                # Small delay to avoid overwhelming the API
-                time.sleep(0.5)
-                
-            except Exception as e:
-                print(f"    Error generating summary: {e}")
-                continue
+
+            print(f"    ✓ {len(batch_summaries)}/{len(batch)} summaries generated successfully")
         
         # Display all summaries
         print("\n\n" + "="*80)
@@ -631,38 +1240,30 @@ KEYWORDS: {keywords_text}
         print("NEWSLETTER EMAIL GENERATION")
         print("="*80 + "\n")
         
-        print("Rendering email template...")
-        html_content = render_newsletter_email(summaries, keywords, len(results))
-        
-        if html_content:
-            print(f"✓ Email HTML rendered successfully ({len(html_content)} characters)\n")
-            
-            # Define recipients from environment variable
-            recipient_email = os.getenv("RECIPIENT_EMAIL")
-            recipients = [recipient_email]
-            
-            print(f"Preparing to send to {len(recipients)} recipient(s):")
-            for recipient in recipients:
-                print(f"  - {recipient}")
-            print()
-            
-            # Generate subject line
-            keywords_text = ", ".join(keywords)
-            current_date = datetime.now().strftime("%B %d, %Y")
-            subject = f"Your {keywords_text} Newsletter - {current_date}"
-            
-            print("Sending newsletter email...")
-            print(f"Subject: {subject}\n")
-            
-            success = send_newsletter_email(html_content, recipients, subject)
-            
-            if success:
-                print("\n" + "="*80)
-                print("Newsletter sent successfully!")
-                print("="*80)
-            else:
-                print("\n" + "="*80)
-                print("Failed to send newsletter email")
-                print("="*80)
+        # Define recipients from environment variable
+        recipient_email = os.getenv("RECIPIENT_EMAIL")
+        recipients = [recipient_email]
+
+        print(f"Preparing to send to {len(recipients)} recipient(s):")
+        for recipient in recipients:
+            print(f"  - {recipient}")
+        print()
+
+        # Generate subject line
+        keywords_text = ", ".join(keywords)
+        current_date = datetime.now().strftime("%B %d, %Y")
+        subject = f"Your {keywords_text} Newsletter - {current_date}"
+
+        print("Rendering and sending newsletter email...")
+        print(f"Subject: {subject}\n")
+
+        success = render_and_send_newsletter(summaries, keywords, len(results), recipients, subject)
+
+        if success:
+            print("\n" + "="*80)
+            print("Newsletter sent successfully!")
+            print("="*80)
         else:
-            print("✗ Failed to render email template. Email not sent.")    
\ No newline at end of file
+            print("\n" + "="*80)
+            print("Failed to send newsletter email")
+            print("="*80)    
\ No newline at end of file